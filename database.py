@@ -1,79 +1,466 @@
 import sqlite3
+import json
 import hashlib
-import datetime
+import hmac
+import os
+import queue
+import threading
+import contextlib
+import pathlib
+from dataclasses import dataclass
+
+# SQL statements are kept as module-level constants so every call hands the
+# exact same string object to sqlite3, which keys its statement cache on it.
+_SQL_FIND_ADMIN = "SELECT * FROM users WHERE username = 'admin'"
+_SQL_INSERT_USER = "INSERT INTO users (username, password, role) VALUES (?, ?, ?)"
+_SQL_CHECK_CREDENTIALS = "SELECT id, username, role, password FROM users WHERE username = ?"
+_SQL_UPDATE_PASSWORD = "UPDATE users SET password = ? WHERE id = ?"
+_SQL_USERS_BY_ROLE = "SELECT id, username FROM users WHERE role = ?"
+_SQL_COUNT_USERS = "SELECT role, COUNT(*) FROM users GROUP BY role"
+# updated_at starts out as the creation time so incremental fetches can key on it
+_SQL_INSERT_TICKET = (
+    "INSERT INTO tickets (title, description, status, requester_id, updated_at) "
+    "VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)"
+)
+_SQL_INSERT_OPEN_TICKET = (
+    "INSERT INTO tickets (title, description, status, requester_id, updated_at) "
+    "VALUES (?, ?, 'Open', ?, CURRENT_TIMESTAMP)"
+)
+
+_SQL_GET_ALL_TICKETS = """
+    SELECT
+        t.id, t.title, t.status,
+        json_object('id', req.id, 'name', req.username) as requester,
+        json_object('id', ag.id, 'name', COALESCE(ag.username, 'Not Assigned')) as agent,
+        t.created_at
+    FROM tickets t
+    JOIN users req ON t.requester_id = req.id
+    LEFT JOIN users ag ON t.agent_id = ag.id
+    ORDER BY t.created_at DESC
+"""
+
+_SQL_GET_AGENT_TICKETS = """
+    SELECT
+        t.id, t.title, t.status, req.username as requester, t.created_at
+    FROM tickets t
+    JOIN users req ON t.requester_id = req.id
+    WHERE t.agent_id = ?
+    ORDER BY t.created_at DESC
+"""
+
+_SQL_GET_REQUESTER_TICKETS = """
+    SELECT
+        t.id, t.title, t.status, COALESCE(ag.username, 'Not Assigned') as agent, t.created_at
+    FROM tickets t
+    LEFT JOIN users ag ON t.agent_id = ag.id
+    WHERE t.requester_id = ?
+    ORDER BY t.created_at DESC
+"""
+
+_SQL_REQUESTER_TICKETS_WITH_TS = """
+    SELECT
+        t.id, t.title, t.status, COALESCE(ag.username, 'Not Assigned') as agent, t.created_at, t.updated_at
+    FROM tickets t
+    LEFT JOIN users ag ON t.agent_id = ag.id
+"""
+# First load: every ticket of the requester
+_SQL_GET_REQUESTER_TICKETS_ALL = _SQL_REQUESTER_TICKETS_WITH_TS + "WHERE t.requester_id = ?"
+# Later loads: a range search on idx_tickets_requester_updated. Inserts stamp updated_at
+# too, so new tickets are caught by the timestamp alone.
+_SQL_GET_REQUESTER_TICKETS_SINCE = _SQL_REQUESTER_TICKETS_WITH_TS + "WHERE t.requester_id = ? AND t.updated_at >= ?"
+
+_SQL_TICKET_DETAILS_SELECT = """
+    SELECT
+        t.id, t.title, t.description, t.status,
+        req.username as requester,
+        COALESCE(ag.username, 'Not Assigned') as agent,
+        t.created_at,
+        t.updated_at,
+        t.resolved_at
+    FROM tickets t
+    JOIN users req ON t.requester_id = req.id
+    LEFT JOIN users ag ON t.agent_id = ag.id
+"""
+_SQL_GET_TICKET_DETAILS = _SQL_TICKET_DETAILS_SELECT + "    WHERE t.id = ?\n"
+_SQL_GET_TICKETS_DETAILS_IN = _SQL_TICKET_DETAILS_SELECT + "    WHERE t.id IN ({})\n"
+
+_SQL_ASSIGN_TICKET = "UPDATE tickets SET agent_id = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+_SQL_RESOLVE_TICKET = (
+    "UPDATE tickets SET status = 'Resolved', updated_at = CURRENT_TIMESTAMP, resolved_at = CURRENT_TIMESTAMP "
+    "WHERE id = ?"
+)
+_SQL_SET_TICKET_STATUS = (
+    "UPDATE tickets SET status = ?, updated_at = CURRENT_TIMESTAMP, resolved_at = NULL WHERE id = ?"
+)
+
+_SQL_WEEKLY_REPORT = """
+    SELECT
+        t.id, t.title, ag.username as agent, t.updated_at
+    FROM tickets t
+    JOIN users ag ON t.agent_id = ag.id
+    WHERE t.status = 'Resolved' AND t.updated_at >= datetime('now', '-7 days')
+    ORDER BY t.updated_at DESC
+"""
+
+_SQL_AGENT_PERFORMANCE = """
+    SELECT
+        u.username,
+        COALESCE(s.assigned, 0) as assigned_tickets,
+        COALESCE(s.resolved, 0) as resolved_tickets,
+        s.sum_resolution_days / NULLIF(s.timed_resolved, 0) as avg_resolution_days
+    FROM
+        users u
+    LEFT JOIN
+        agent_stats s ON u.id = s.agent_id
+    WHERE
+        u.role = 'agent'
+    ORDER BY
+        resolved_tickets DESC
+"""
+
+# Per-agent counters kept current by the triggers below, so the performance
+# report reads one row per agent instead of aggregating the whole tickets table.
+# timed_resolved counts resolved tickets that have a resolved_at to average over.
+_SQL_CREATE_AGENT_STATS = """
+    CREATE TABLE IF NOT EXISTS agent_stats (
+        agent_id INTEGER PRIMARY KEY,
+        assigned INTEGER NOT NULL DEFAULT 0,
+        resolved INTEGER NOT NULL DEFAULT 0,
+        timed_resolved INTEGER NOT NULL DEFAULT 0,
+        sum_resolution_days REAL NOT NULL DEFAULT 0,
+        FOREIGN KEY (agent_id) REFERENCES users (id)
+    )
+"""
+
+_SQL_BACKFILL_AGENT_STATS = """
+    INSERT OR REPLACE INTO agent_stats (agent_id, assigned, resolved, timed_resolved, sum_resolution_days)
+    SELECT
+        agent_id,
+        COUNT(*),
+        SUM(status = 'Resolved'),
+        COUNT(CASE WHEN status = 'Resolved' THEN resolved_at END),
+        TOTAL(CASE WHEN status = 'Resolved' THEN JULIANDAY(resolved_at) - JULIANDAY(created_at) END)
+    FROM tickets
+    WHERE agent_id IS NOT NULL
+    GROUP BY agent_id
+"""
+
+# Adds (sign=+) or removes (sign=-) one ticket row's contribution to its agent's counters
+_AGENT_STATS_APPLY = """
+        UPDATE agent_stats SET
+            assigned = assigned {sign} 1,
+            resolved = resolved {sign} ({row}.status = 'Resolved'),
+            timed_resolved = timed_resolved {sign} ({row}.status = 'Resolved' AND {row}.resolved_at IS NOT NULL),
+            sum_resolution_days = sum_resolution_days {sign} CASE WHEN {row}.status = 'Resolved'
+                THEN IFNULL(JULIANDAY({row}.resolved_at) - JULIANDAY({row}.created_at), 0) ELSE 0 END
+        WHERE agent_id = {row}.agent_id;"""
+
+_AGENT_STATS_ENSURE = """
+        INSERT OR IGNORE INTO agent_stats (agent_id) SELECT NEW.agent_id WHERE NEW.agent_id IS NOT NULL;"""
+
+_SQL_AGENT_STATS_TRIGGERS = (
+    "CREATE TRIGGER IF NOT EXISTS trg_agent_stats_insert AFTER INSERT ON tickets BEGIN"
+    + _AGENT_STATS_ENSURE
+    + _AGENT_STATS_APPLY.format(sign="+", row="NEW")
+    + "\n    END",
+    "CREATE TRIGGER IF NOT EXISTS trg_agent_stats_update "
+    "AFTER UPDATE OF agent_id, status, created_at, resolved_at ON tickets BEGIN"
+    + _AGENT_STATS_APPLY.format(sign="-", row="OLD")
+    + _AGENT_STATS_ENSURE
+    + _AGENT_STATS_APPLY.format(sign="+", row="NEW")
+    + "\n    END",
+    "CREATE TRIGGER IF NOT EXISTS trg_agent_stats_delete AFTER DELETE ON tickets BEGIN"
+    + _AGENT_STATS_APPLY.format(sign="-", row="OLD")
+    + "\n    END",
+)
+
+# Full schema, run as one script inside a single transaction on startup
+_SQL_SCHEMA = """
+    BEGIN;
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        password BLOB NOT NULL,
+        role TEXT NOT NULL CHECK(role IN ('admin', 'agent', 'requester'))
+    );
+    CREATE TABLE IF NOT EXISTS tickets (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        description TEXT NOT NULL,
+        status TEXT NOT NULL CHECK(status IN ('Open', 'In Progress', 'Resolved')),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP,
+        requester_id INTEGER NOT NULL,
+        agent_id INTEGER,
+        resolved_at TIMESTAMP,
+        FOREIGN KEY (requester_id) REFERENCES users (id),
+        FOREIGN KEY (agent_id) REFERENCES users (id)
+    );
+    -- Covers the per-agent aggregation in the performance and weekly reports
+    CREATE INDEX IF NOT EXISTS idx_tickets_agent_status ON tickets(agent_id, status, resolved_at, created_at);
+    -- Serve the per-user ticket lists and the weekly report in index order
+    CREATE INDEX IF NOT EXISTS idx_tickets_requester ON tickets(requester_id, created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_tickets_requester_updated ON tickets(requester_id, updated_at);
+    CREATE INDEX IF NOT EXISTS idx_tickets_agent ON tickets(agent_id, created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_tickets_status_updated ON tickets(status, updated_at DESC);
+""" + _SQL_CREATE_AGENT_STATS + ";\n" + ";\n".join(_SQL_AGENT_STATS_TRIGGERS) + """;
+    COMMIT;
+"""
+
+# scrypt parameters for password hashing; stored hashes are salt || digest
+_SCRYPT_N = 2 ** 14
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+_SALT_SIZE = 16
+_DIGEST_SIZE = 32
+# Verified against when the username doesn't exist, so unknown and known accounts take as long
+_DUMMY_HASH = bytes(_SALT_SIZE + _DIGEST_SIZE)
+
+# Bumped whenever _update_schema gains a new migration step
+_SCHEMA_VERSION = 2
+
+# Shared by the writer and reader connections. Statements only ever bind plain
+# int/str/bytes values (timestamps come from CURRENT_TIMESTAMP), so no type
+# detection is needed and sqlite3 never consults its adapter registry.
+_CONNECT_OPTIONS = dict(
+    detect_types=0, isolation_level=None, check_same_thread=False, cached_statements=256
+)
+
+# Number of read-only connections kept warm for concurrent callers; the GUI reads
+# from its worker thread and now and then the Tk thread, so a few are plenty
+READER_POOL_SIZE = 4
+
+# Upper bound on ids bound into a single IN (...) list, below SQLite's variable limit
+IN_LIST_CHUNK_SIZE = 500
+
+# Rows fetched per round-trip when streaming report results
+STREAM_BATCH_SIZE = 1000
+
+@dataclass(slots=True)
+class TicketDetail:
+    """Full details of a single ticket, as shown in the ticket details popup."""
+    id: int
+    title: str
+    description: str
+    status: str
+    requester: str
+    agent: str
+    created_at: str
+    updated_at: str | None
+    resolved_at: str | None
+
+
+@dataclass(slots=True)
+class _ReaderLease:
+    """A pooled reader held by one thread, and how many open leases currently share it."""
+    conn: sqlite3.Connection
+    depth: int
+
 
 class Database:
     """Handles all database operations for the ticketing system."""
-    def __init__(self, db_name="ticketing_system.db"):
-        self.conn = sqlite3.connect(db_name)
+    def __init__(self, db_name="ticketing_system.db", pool_size=READER_POOL_SIZE):
+        self.db_name = db_name
+        # SQLite allows a single writer, so every write goes through this one
+        # connection while holding the lock; reads never take it.
+        self._write_lock = threading.RLock()
+        self._tx_depth = 0  # Nesting level of transaction() blocks held by the writer
+        # The user list rarely changes, so role lookups and counts are memoized
+        # per instance and dropped by _invalidate_user_caches on every user write.
+        # Writes and reads can run on different threads; the generation counter keeps
+        # a read that started before an invalidation from storing its stale result.
+        self._user_cache = {}
+        self._user_cache_lock = threading.Lock()
+        self._user_cache_generation = 0
+        self.conn = self._connect()
         self.cursor = self.conn.cursor()
-        self.create_tables()
         self._update_schema() # Check and update schema on startup
+        self.create_tables()
         self.create_admin_if_not_exists()
 
-    def _update_schema(self):
-        """Checks and updates the database schema to include new columns."""
+        # Readers check out a warm connection from the pool; under WAL they
+        # run in parallel with each other and with the writer above.
+        self._readers = queue.Queue()
+        # Thread id -> the _ReaderLease that thread holds, so nested reads reuse its connection
+        self._leases = {}
+        self._leases_lock = threading.Lock()
+        if db_name == ":memory:":
+            # Every in-memory connection is a separate database, so share the writer
+            self._readers.put(self.conn)
+        else:
+            for _ in range(pool_size):
+                self._readers.put(self._connect(read_only=True))
+
+    def _connect(self, read_only=False):
+        """Opens a new tuned connection to the database file."""
+        if read_only:
+            uri = pathlib.Path(self.db_name).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, **_CONNECT_OPTIONS)
+        else:
+            conn = sqlite3.connect(self.db_name, **_CONNECT_OPTIONS)
+            # The journal mode is persistent and can only be changed by a writer
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.row_factory = sqlite3.Row
+        self._apply_pragmas(conn)
+        return conn
+
+    @contextlib.contextmanager
+    def _lease_reader(self):
+        """
+        Borrows a pooled connection for a read and returns it afterwards.
+        Leases nest per thread: a read made while the same thread already holds a connection
+        (for instance inside a _stream loop) reuses it instead of waiting on the pool, so
+        per-row lookups during iteration can't deadlock, even with a pool of one.
+        The connection goes back once every lease sharing it has ended, in whatever order
+        they end and on whichever thread, since each lease releases the record it acquired.
+        """
+        owner = threading.get_ident()
+        with self._leases_lock:
+            lease = self._leases.get(owner)
+            if lease is not None:
+                lease.depth += 1
+        if lease is None:
+            lease = _ReaderLease(self._readers.get(), 1)
+            with self._leases_lock:
+                self._leases[owner] = lease
         try:
-            # Check if 'resolved_at' column exists in 'tickets' table
-            self.cursor.execute("PRAGMA table_info(tickets)")
-            columns = [info[1] for info in self.cursor.fetchall()]
-            if 'resolved_at' not in columns:
-                self.cursor.execute("ALTER TABLE tickets ADD COLUMN resolved_at TIMESTAMP")
+            yield lease.conn
+        finally:
+            with self._leases_lock:
+                lease.depth -= 1
+                released = lease.depth == 0
+                if released and self._leases.get(owner) is lease:
+                    del self._leases[owner]
+            if released:
+                self._readers.put(lease.conn)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Groups several writes into one transaction that commits on exit and rolls back on error.
+        Nested blocks, including the ones inside the write methods, join the outermost transaction.
+        """
+        with self._write_lock:
+            if self._tx_depth == 0:
+                self.conn.execute("BEGIN IMMEDIATE")
+            self._tx_depth += 1
+            try:
+                yield
+            except BaseException:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self.conn.rollback()
+                raise
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
                 self.conn.commit()
-                print("Database schema updated: Added 'resolved_at' column to tickets table.")
-        except Exception as e:
-            # This might fail if the tickets table doesn't exist yet, which is fine.
-            pass
+
+    def _stream(self, sql, params=()):
+        """
+        Yields the rows of a query in batches instead of materializing them all.
+        The generator holds its reader until it is exhausted or closed (closing it from any
+        thread, including by garbage collection, is safe). Reads from the thread iterating it
+        share that connection meanwhile, but each open stream keeps one connection out of the
+        pool: don't leave more than the pool size suspended across threads, or other readers wait.
+        """
+        with self._lease_reader() as conn:
+            cursor = conn.execute(sql, params)
+            cursor.arraysize = STREAM_BATCH_SIZE
+            while batch := cursor.fetchmany():
+                yield from batch
+
+    def _apply_pragmas(self, conn):
+        """Tunes a connection for WAL journaling and a large in-memory page cache."""
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        conn.execute("PRAGMA foreign_keys=ON")
+
+    def _update_schema(self):
+        """Migrates older databases forward, gated on PRAGMA user_version."""
+        version = self.cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _SCHEMA_VERSION:
+            return
+
+        # A brand new database has no tickets table yet; create_tables builds it
+        # in its current shape, so only the version stamp is needed.
+        self.cursor.execute("PRAGMA table_info(tickets)")
+        columns = [info[1] for info in self.cursor.fetchall()]
+
+        with self.transaction():
+            if columns and version < 1:
+                # Databases created before resolution times were tracked lack 'resolved_at'
+                if 'resolved_at' not in columns:
+                    self.cursor.execute("ALTER TABLE tickets ADD COLUMN resolved_at TIMESTAMP")
+                    print("Database schema updated: Added 'resolved_at' column to tickets table.")
+
+            if columns and version < 2:
+                # Seed the agent_stats counters from existing tickets; triggers keep them current from here on
+                self.cursor.execute(_SQL_CREATE_AGENT_STATS)
+                self.cursor.execute(_SQL_BACKFILL_AGENT_STATS)
+                print("Database schema updated: Added 'agent_stats' summary table.")
+
+            self.cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
 
     def create_tables(self):
-        """Creates the necessary tables if they don't already exist."""
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                password TEXT NOT NULL,
-                role TEXT NOT NULL CHECK(role IN ('admin', 'agent', 'requester'))
-            )
-        ''')
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS tickets (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                description TEXT NOT NULL,
-                status TEXT NOT NULL CHECK(status IN ('Open', 'In Progress', 'Resolved')),
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP,
-                requester_id INTEGER NOT NULL,
-                agent_id INTEGER,
-                FOREIGN KEY (requester_id) REFERENCES users (id),
-                FOREIGN KEY (agent_id) REFERENCES users (id)
-            )
-        ''')
-        self.conn.commit()
+        """Creates the necessary tables, indexes and triggers if they don't already exist."""
+        try:
+            self.cursor.executescript(_SQL_SCHEMA)
+        except BaseException:
+            if self.conn.in_transaction:
+                self.conn.rollback()
+            raise
 
     def create_admin_if_not_exists(self):
         """Creates a default admin user if one doesn't exist."""
-        self.cursor.execute("SELECT * FROM users WHERE username = 'admin'")
+        self.cursor.execute(_SQL_FIND_ADMIN)
         if not self.cursor.fetchone():
             hashed_password = self._hash_password('admin')
-            self.cursor.execute(
-                "INSERT INTO users (username, password, role) VALUES (?, ?, ?)",
-                ('admin', hashed_password, 'admin')
-            )
-            self.conn.commit()
+            with self.transaction():
+                self.cursor.execute(_SQL_INSERT_USER, ('admin', hashed_password, 'admin'))
 
-    def _hash_password(self, password):
-        """Hashes a password for secure storage."""
-        return hashlib.sha256(password.encode()).hexdigest()
+    def _hash_password(self, password, salt=None):
+        """Hashes a password with scrypt and returns salt || digest for storage."""
+        if salt is None:
+            salt = os.urandom(_SALT_SIZE)
+        digest = hashlib.scrypt(
+            password.encode(), salt=salt, n=_SCRYPT_N, r=_SCRYPT_R, p=_SCRYPT_P, dklen=_DIGEST_SIZE
+        )
+        return salt + digest
+
+    def _verify_password(self, password, stored):
+        """Checks a password against a stored hash in constant time."""
+        if isinstance(stored, str):
+            # Legacy unsalted SHA-256 hex digest from before scrypt was introduced;
+            # compare the raw 32-byte digests rather than 64 hex characters
+            try:
+                stored_digest = bytes.fromhex(stored)
+            except ValueError:
+                return False
+            return hmac.compare_digest(hashlib.sha256(password.encode()).digest(), stored_digest)
+        salt = stored[:_SALT_SIZE]
+        return hmac.compare_digest(self._hash_password(password, salt), stored)
 
     def check_credentials(self, username, password):
         """Verifies user credentials and returns user data if valid."""
-        hashed_password = self._hash_password(password)
-        self.cursor.execute(
-            "SELECT id, username, role FROM users WHERE username = ? AND password = ?",
-            (username, hashed_password)
-        )
-        return self.cursor.fetchone()
+        with self._lease_reader() as conn:
+            row = conn.execute(_SQL_CHECK_CREDENTIALS, (username,)).fetchone()
+        if not row:
+            # Still pay for one scrypt run so login timing doesn't reveal which usernames exist
+            self._verify_password(password, _DUMMY_HASH)
+            return None
+        if isinstance(row[3], str):
+            # Legacy SHA-256 checks are instant; add the scrypt run they skip for the same reason
+            self._verify_password(password, _DUMMY_HASH)
+        if not self._verify_password(password, row[3]):
+            return None
+        if isinstance(row[3], str):
+            # Upgrade the legacy hash now that we know the plain password
+            hashed_password = self._hash_password(password)
+            with self.transaction():
+                self.cursor.execute(_SQL_UPDATE_PASSWORD, (hashed_password, row[0]))
+        return row[:3]
 
     def register_user(self, username, password, role='requester'):
         """Registers a new user (requester or agent)."""
@@ -81,164 +468,166 @@ class Database:
             return False, "Invalid role specified."
         try:
             hashed_password = self._hash_password(password)
-            self.cursor.execute(
-                "INSERT INTO users (username, password, role) VALUES (?, ?, ?)",
-                (username, hashed_password, role)
-            )
-            self.conn.commit()
+            with self.transaction():
+                self.cursor.execute(_SQL_INSERT_USER, (username, hashed_password, role))
+            self._invalidate_user_caches()
             return True, "User registered successfully."
         except sqlite3.IntegrityError:
             return False, "Username already exists."
         except Exception as e:
             return False, f"An error occurred: {e}"
 
+    def register_users_bulk(self, rows):
+        """
+        Registers many users in a single transaction.
+        rows: An iterable of (username, password, role) tuples.
+        """
+        rows = list(rows)
+        if any(role not in ['requester', 'agent'] for _, _, role in rows):
+            return False, "Invalid role specified."
+        hashed_rows = [(username, self._hash_password(password), role) for username, password, role in rows]
+        try:
+            with self.transaction():
+                self.cursor.executemany(_SQL_INSERT_USER, hashed_rows)
+            self._invalidate_user_caches()
+            return True, f"{len(hashed_rows)} users registered successfully."
+        except sqlite3.IntegrityError:
+            return False, "Username already exists."
+        except Exception as e:
+            return False, f"An error occurred: {e}"
+
+    def _invalidate_user_caches(self):
+        """Drops memoized user lookups after the users table changes."""
+        with self._user_cache_lock:
+            self._user_cache.clear()
+            self._user_cache_generation += 1
+
+    def _cached_user_query(self, key, query, *args):
+        """Returns query(*args), memoized under `key` until the next _invalidate_user_caches."""
+        with self._user_cache_lock:
+            if key in self._user_cache:
+                return self._user_cache[key]
+            generation = self._user_cache_generation
+        result = query(*args)
+        with self._user_cache_lock:
+            if generation == self._user_cache_generation:
+                self._user_cache[key] = result
+        return result
+
+    def _query_users_by_role(self, role):
+        with self._lease_reader() as conn:
+            return tuple(conn.execute(_SQL_USERS_BY_ROLE, (role,)).fetchall())
+
+    def _query_count_users(self):
+        with self._lease_reader() as conn:
+            return dict(conn.execute(_SQL_COUNT_USERS).fetchall())
+
     def get_users_by_role(self, role):
         """Fetches all users with a specific role."""
-        self.cursor.execute("SELECT id, username FROM users WHERE role = ?", (role,))
-        return self.cursor.fetchall()
+        return self._cached_user_query(('users_by_role', role), self._query_users_by_role, role)
 
     def count_users(self):
         """Counts the number of users for each role."""
-        self.cursor.execute("SELECT role, COUNT(*) FROM users GROUP BY role")
-        return dict(self.cursor.fetchall())
+        # Copy so callers can't modify the cached mapping
+        return dict(self._cached_user_query('count_users', self._query_count_users))
 
     def create_ticket(self, title, description, requester_id):
         """Creates a new ticket."""
-        self.cursor.execute(
-            "INSERT INTO tickets (title, description, status, requester_id) VALUES (?, ?, ?, ?)",
-            (title, description, 'Open', requester_id)
-        )
-        self.conn.commit()
+        with self.transaction():
+            self.cursor.execute(_SQL_INSERT_TICKET, (title, description, 'Open', requester_id))
+
+    def create_tickets_bulk(self, rows):
+        """
+        Creates many tickets in a single transaction.
+        rows: An iterable of (title, description, requester_id) tuples.
+        """
+        with self.transaction():
+            self.cursor.executemany(_SQL_INSERT_OPEN_TICKET, rows)
 
     def get_all_tickets(self):
-        """Retrieves all tickets with user details for the admin view."""
-        query = """
-            SELECT
-                t.id, t.title, t.status,
-                req.username as requester,
-                COALESCE(ag.username, 'Not Assigned') as agent,
-                t.created_at
-            FROM tickets t
-            JOIN users req ON t.requester_id = req.id
-            LEFT JOIN users ag ON t.agent_id = ag.id
-            ORDER BY t.created_at DESC
-        """
-        self.cursor.execute(query)
-        return self.cursor.fetchall()
+        """
+        Retrieves all tickets with user details for the admin view.
+        Yields: Tuples of (id, title, status, requester, agent, created_at), where
+        requester and agent are dicts with 'id' and 'name' keys.
+        """
+        for row in self._stream(_SQL_GET_ALL_TICKETS):
+            yield (row[0], row[1], row[2], json.loads(row[3]), json.loads(row[4]), row[5])
 
     def get_agent_tickets(self, agent_id):
         """Retrieves tickets assigned to a specific agent."""
-        query = """
-            SELECT
-                t.id, t.title, t.status, req.username as requester, t.created_at
-            FROM tickets t
-            JOIN users req ON t.requester_id = req.id
-            WHERE t.agent_id = ?
-            ORDER BY t.created_at DESC
-        """
-        self.cursor.execute(query, (agent_id,))
-        return self.cursor.fetchall()
+        with self._lease_reader() as conn:
+            return conn.execute(_SQL_GET_AGENT_TICKETS, (agent_id,)).fetchall()
+
+    def _fetch_tuples(self, sql, params):
+        """Runs a read and returns plain tuples, skipping the sqlite3.Row wrapper on hot paths."""
+        with self._lease_reader() as conn:
+            cur = conn.cursor()
+            cur.row_factory = None
+            return cur.execute(sql, params).fetchall()
 
     def get_requester_tickets(self, requester_id):
-        """Retrieves tickets created by a specific requester."""
-        query = """
-            SELECT
-                t.id, t.title, t.status, COALESCE(ag.username, 'Not Assigned') as agent, t.created_at
-            FROM tickets t
-            LEFT JOIN users ag ON t.agent_id = ag.id
-            WHERE t.requester_id = ?
-            ORDER BY t.created_at DESC
-        """
-        self.cursor.execute(query, (requester_id,))
-        return self.cursor.fetchall()
+        """
+        Retrieves tickets created by a specific requester.
+        Returns: Tuples of (id, title, status, agent, created_at), ready to use as Treeview values.
+        """
+        return self._fetch_tuples(_SQL_GET_REQUESTER_TICKETS, (requester_id,))
+
+    def get_requester_tickets_since(self, requester_id, last_ts=None):
+        """
+        Retrieves a requester's tickets created or updated at or after `last_ts`, or all of
+        them when `last_ts` is None. `>=` re-sends rows stamped in the same second as the last
+        fetch, so callers merge by id.
+        Returns: Tuples of (id, title, status, agent, created_at, updated_at), in no set order.
+        """
+        if last_ts is None:
+            return self._fetch_tuples(_SQL_GET_REQUESTER_TICKETS_ALL, (requester_id,))
+        return self._fetch_tuples(_SQL_GET_REQUESTER_TICKETS_SINCE, (requester_id, last_ts))
         
     def get_ticket_details(self, ticket_id):
-        """Retrieves full details for a single ticket."""
-        query = """
-            SELECT
-                t.id, t.title, t.description, t.status,
-                req.username as requester,
-                COALESCE(ag.username, 'Not Assigned') as agent,
-                t.created_at,
-                t.updated_at,
-                t.resolved_at
-            FROM tickets t
-            JOIN users req ON t.requester_id = req.id
-            LEFT JOIN users ag ON t.agent_id = ag.id
-            WHERE t.id = ?
-        """
-        self.cursor.execute(query, (ticket_id,))
-        return self.cursor.fetchone()
+        """Retrieves full details for a single ticket as a TicketDetail, or None if it doesn't exist."""
+        with self._lease_reader() as conn:
+            row = conn.execute(_SQL_GET_TICKET_DETAILS, (ticket_id,)).fetchone()
+        return TicketDetail(*row) if row else None
+
+    def get_tickets_details_bulk(self, ticket_ids):
+        """
+        Retrieves full details for many tickets with one IN-list query per chunk.
+        Returns: A dict mapping ticket id to its TicketDetail.
+        """
+        ticket_ids = list(dict.fromkeys(ticket_ids))
+        details = {}
+        with self._lease_reader() as conn:
+            for start in range(0, len(ticket_ids), IN_LIST_CHUNK_SIZE):
+                chunk = ticket_ids[start:start + IN_LIST_CHUNK_SIZE]
+                sql = _SQL_GET_TICKETS_DETAILS_IN.format(",".join("?" * len(chunk)))
+                for row in conn.execute(sql, chunk):
+                    details[row[0]] = TicketDetail(*row)
+        return details
 
     def assign_ticket(self, ticket_id, agent_id):
         """Assigns a ticket to an agent."""
-        self.cursor.execute(
-            "UPDATE tickets SET agent_id = ?, updated_at = ? WHERE id = ?",
-            (agent_id, datetime.datetime.now(), ticket_id)
-        )
-        self.conn.commit()
+        with self.transaction():
+            self.cursor.execute(_SQL_ASSIGN_TICKET, (agent_id, ticket_id))
 
     def update_ticket_status(self, ticket_id, new_status):
         """Updates the status of a ticket."""
-        now = datetime.datetime.now()
-        
-        # Base query and parameters
-        sql = "UPDATE tickets SET status = ?, updated_at = ? "
-        params = [new_status, now]
-
-        # Handle the 'resolved_at' field specifically
-        if new_status == 'Resolved':
-            # Add the resolved timestamp to the query
-            sql += ", resolved_at = ? "
-            params.append(now)
-        else:
-            # Explicitly set resolved_at to NULL if status is anything other than Resolved
-            sql += ", resolved_at = NULL "
-
-        # Add the WHERE clause to target the correct ticket
-        sql += "WHERE id = ?"
-        params.append(ticket_id)
-
-        # Execute the constructed query and commit the changes
-        self.cursor.execute(sql, tuple(params))
-        self.conn.commit()
+        # Pick one of two fixed statements so the statement cache always hits
+        with self.transaction():
+            if new_status == 'Resolved':
+                # Stamp the resolved timestamp along with the update
+                self.cursor.execute(_SQL_RESOLVE_TICKET, (ticket_id,))
+            else:
+                # Explicitly set resolved_at to NULL if status is anything other than Resolved
+                self.cursor.execute(_SQL_SET_TICKET_STATUS, (new_status, ticket_id))
         
     def get_weekly_report(self):
         """Generates a report of tickets closed in the last 7 days."""
-        seven_days_ago = datetime.datetime.now() - datetime.timedelta(days=7)
-        query = """
-            SELECT
-                t.id, t.title, ag.username as agent, t.updated_at
-            FROM tickets t
-            JOIN users ag ON t.agent_id = ag.id
-            WHERE t.status = 'Resolved' AND t.updated_at >= ?
-            ORDER BY t.updated_at DESC
-        """
-        self.cursor.execute(query, (seven_days_ago,))
-        return self.cursor.fetchall()
+        return self._stream(_SQL_WEEKLY_REPORT)
 
     def get_agent_performance_report(self):
         """
         Calculates performance metrics for each agent.
-        Returns: A list of tuples with (agent_name, assigned_count, resolved_count, avg_resolution_days).
-        """
-        query = """
-            SELECT
-                u.username,
-                COUNT(t.id) as assigned_tickets,
-                SUM(CASE WHEN t.status = 'Resolved' THEN 1 ELSE 0 END) as resolved_tickets,
-                AVG(CASE WHEN t.status = 'Resolved' THEN JULIANDAY(t.resolved_at) - JULIANDAY(t.created_at) ELSE NULL END) as avg_resolution_days
-            FROM
-                users u
-            LEFT JOIN
-                tickets t ON u.id = t.agent_id
-            WHERE
-                u.role = 'agent'
-            GROUP BY
-                u.id, u.username
-            ORDER BY
-                resolved_tickets DESC
-        """
-        self.cursor.execute(query)
-        return self.cursor.fetchall()
+        Yields: Rows of (agent_name, assigned_count, resolved_count, avg_resolution_days).
+        """
+        return self._stream(_SQL_AGENT_PERFORMANCE)
 
@@ -1,3 +1,8 @@
+import functools
+import queue
+import time
+import threading
+import weakref
 import tkinter as tk
 from tkinter import ttk, messagebox
 from database import Database
@@ -7,39 +12,60 @@ try:
     FPDF_AVAILABLE = True
 except ImportError:
     FPDF_AVAILABLE = False
+try:
+    # Optional: lays the whole table out in one pass, preferred over FPDF when installed
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import mm
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    REPORTLAB_AVAILABLE = False
     
 # Use ttkbootstrap for modern themes and widgets
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 from ttkbootstrap.dialogs import Messagebox
 
+_DEFAULT_FONT = ('Arial', 12)
+_TS_TABLE = str.maketrans({'T': ' '})
+_SUFFIXES = ('d', 'h', 'm')
+
+# Requester row colors (background, foreground), one Treeview tag per ticket status
+_STATUS_COLORS = {
+    'Open': ('red', 'white'),
+    'In Progress': ('orange', 'black'),
+    'Resolved': ('green', 'white'),
+}
+# Canonical status strings and their shared tag tuples, so every row reuses the same objects
+_STATUS_INTERN = {status: status for status in _STATUS_COLORS}
+_STATUS_TAGS = {status: (status,) for status in _STATUS_COLORS}
+
+@functools.lru_cache(maxsize=4096)
+def _parse_sqlite_ts(time_str):
+    """Parses a SQLite timestamp string; repeated strings are served from the cache."""
+    # Handle potential timezone info if present, but SQLite format is usually without it
+    time_str = time_str.partition('+')[0]
+    try:
+        # fromisoformat handles a space or 'T' separator, with or without fractional seconds
+        return datetime.fromisoformat(time_str)
+    except ValueError:
+        # Fall back for anything that isn't plain ISO 8601
+        return datetime.strptime(time_str.translate(_TS_TABLE), "%Y-%m-%d %H:%M:%S.%f")
+
+
+@functools.lru_cache(maxsize=2048)
 def format_timedelta(start_time_str, end_time_str):
     """Formats the duration between two ISO format time strings."""
     if not start_time_str or not end_time_str:
         return "N/A"
-    
-    # Handle potential timezone info if present, but SQLite format is usually without it
-    start_time_str = start_time_str.split('+')[0]
-    end_time_str = end_time_str.split('+')[0]
-    
-    # SQLite can have a space or a 'T' separator
-    start_time_str = start_time_str.replace('T', ' ')
-    end_time_str = end_time_str.replace('T', ' ')
-    
-    try:
-        # Accommodate formats with or without milliseconds
-        fmt = "%Y-%m-%d %H:%M:%S.%f"
-        start_time = datetime.strptime(start_time_str, fmt)
-    except ValueError:
-        fmt = "%Y-%m-%d %H:%M:%S"
-        start_time = datetime.strptime(start_time_str, fmt)
-        
-    try:
-        fmt = "%Y-%m-%d %H:%M:%S.%f"
-        end_time = datetime.strptime(end_time_str, fmt)
-    except ValueError:
-        fmt = "%Y-%m-%d %H:%M:%S"
-        end_time = datetime.strptime(end_time_str, fmt)
+    if start_time_str == end_time_str:
+        # Resolved in the same instant it was created; nothing to parse
+        return "0s"
+
+    start_time = _parse_sqlite_ts(start_time_str)
+    end_time = _parse_sqlite_ts(end_time_str)
 
     duration = end_time - start_time
     
@@ -48,9 +74,9 @@ def format_timedelta(start_time_str, end_time_str):
     minutes, seconds = divmod(remainder, 60)
     
     parts = []
-    if days > 0: parts.append(f"{days}d")
-    if hours > 0: parts.append(f"{hours}h")
-    if minutes > 0: parts.append(f"{minutes}m")
+    for value, suffix in zip((days, hours, minutes), _SUFFIXES):
+        if value > 0:
+            parts.append(f"{value}{suffix}")
     # Only show seconds if the duration is less than a minute
     if not parts or (days == 0 and hours == 0 and minutes == 0):
         parts.append(f"{seconds}s")
@@ -58,9 +84,218 @@ def format_timedelta(start_time_str, end_time_str):
     return " ".join(parts)
 
 
+def _format_ticket_details(details, include_agent=True):
+    """Builds the text of the ticket details popup; agents don't need their own name or the last update."""
+    parts = [
+        f"ID: {details.id}",
+        f"Title: {details.title}",
+        f"Description: {details.description}",
+        f"Status: {details.status}",
+        f"Requester: {details.requester}",
+    ]
+    if include_agent:
+        parts.append(f"Agent: {details.agent}")
+    parts.append(f"Created At: {details.created_at}")
+    if include_agent:
+        parts.append(f"Last Updated: {details.updated_at or 'N/A'}")
+    if details.resolved_at: # resolved_at is not null
+        parts.append(f"Resolution Time: {format_timedelta(details.created_at, details.resolved_at)}")
+    return "\n".join(parts)
+
+
+def _track_ticket_selection(dashboard):
+    """
+    Keeps dashboard._selected_ticket set to (ticket_id, status) of the row selected in its
+    tickets_tree, or None, so the action buttons don't re-read the tree on every click.
+    """
+    tree = dashboard.tickets_tree
+    dashboard._selected_ticket = None
+
+    def on_select(event=None):
+        selection = tree.selection()
+        if selection:
+            values = tree.item(selection[0], 'values')
+            dashboard._selected_ticket = (int(values[0]), values[2])
+        else:
+            dashboard._selected_ticket = None
+
+    tree.bind("<<TreeviewSelect>>", on_select)
+
+
+def _refill_tree(tree, rows, tag_column=None, pool=None):
+    """
+    Replaces every row of a Treeview with one bulk delete followed by the inserts,
+    then flushes pending redraws once. Optionally tags each row with one of its values.
+    With a `pool` list, rows are detached instead of deleted and their items are refilled
+    and reattached on the next call; the pool grows to the most rows ever shown.
+    Returns: The number of rows inserted.
+    """
+    if not tree.winfo_exists():
+        # The dashboard was torn down while the rows were being fetched
+        return 0
+    if pool is None:
+        tree.delete(*tree.get_children())
+    else:
+        # Pooled items come back showing other tickets, so don't let them keep a highlight
+        tree.selection_remove(tree.selection())
+        tree.detach(*tree.get_children())
+    count = 0
+    for values in rows:
+        tags = (values[tag_column],) if tag_column is not None else ()
+        if pool is not None and count < len(pool):
+            iid = pool[count]
+            tree.item(iid, values=values, tags=tags)
+            tree.reattach(iid, "", "end")
+        else:
+            iid = tree.insert("", "end", values=values, tags=tags)
+            if pool is not None:
+                pool.append(iid)
+        count += 1
+    tree.update_idletasks()
+    return count
+
+
+def _refill_tree_in_chunks(tree, rows, on_done=None, chunk_size=100, tag_column=None):
+    """
+    Like _refill_tree, but inserts `chunk_size` rows per idle callback so the event
+    loop keeps pumping during large loads. Calls on_done(row_count) once all rows are in.
+    A new call on the same tree cancels the chunks still pending from the previous one.
+    """
+    if not tree.winfo_exists():
+        # The dashboard was torn down while the rows were being fetched
+        return
+    pending = getattr(tree, '_pending_refill', None)
+    if pending is not None:
+        tree.after_cancel(pending)
+        tree._pending_refill = None
+    rows = list(rows)
+    tree.delete(*tree.get_children())
+
+    def insert_chunk(start):
+        tree._pending_refill = None
+        if not tree.winfo_exists():
+            return
+        for values in rows[start:start + chunk_size]:
+            tags = (values[tag_column],) if tag_column is not None else ()
+            tree.insert("", "end", values=values, tags=tags)
+        if start + chunk_size < len(rows):
+            tree._pending_refill = tree.after_idle(insert_chunk, start + chunk_size)
+        elif on_done is not None:
+            on_done(len(rows))
+
+    tree._pending_refill = tree.after_idle(insert_chunk, 0)
+
+
+_PDF_COL_WIDTHS = (15, 80, 40, 50) # millimetres
+_PDF_HEADERS = ("ID", "Title", "Agent", "Resolved At")
+
+
+def _show_toast(parent, message, duration_ms=1500):
+    """Shows a borderless, non-modal note near the bottom-right of parent that closes itself."""
+    toast = tb.Toplevel(parent)
+    toast.overrideredirect(True)
+    tb.Label(toast, text=message, bootstyle="inverse-success", padding=10).pack()
+    toast.update_idletasks()
+    x = parent.winfo_rootx() + parent.winfo_width() - toast.winfo_reqwidth() - 20
+    y = parent.winfo_rooty() + parent.winfo_height() - toast.winfo_reqheight() - 20
+    toast.geometry(f"+{x}+{y}")
+    toast.after(duration_ms, toast.destroy)
+
+
+def _write_weekly_report_pdf(report_data, filename):
+    """Lays out the weekly report rows as a PDF table and writes it to filename."""
+    if REPORTLAB_AVAILABLE:
+        _write_weekly_report_reportlab(report_data, filename)
+    else:
+        _write_weekly_report_fpdf(report_data, filename)
+
+
+def _write_weekly_report_reportlab(report_data, filename):
+    """Builds the report as a single reportlab Table, laid out in one pass."""
+    data = [_PDF_HEADERS] + [tuple(map(str, row)) for row in report_data]
+    table = Table(
+        data,
+        colWidths=[width * mm for width in _PDF_COL_WIDTHS],
+        repeatRows=1,
+        style=TableStyle([
+            ('FONT', (0, 0), (-1, 0), 'Helvetica-Bold', 10),
+            ('FONT', (0, 1), (-1, -1), 'Helvetica', 10),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+        ]),
+    )
+    title = Paragraph("Weekly Resolved Tickets Report", getSampleStyleSheet()['Title'])
+    SimpleDocTemplate(filename, pagesize=A4).build([title, Spacer(1, 10 * mm), table])
+
+
+def _write_weekly_report_fpdf(report_data, filename):
+    """Lays out the weekly report rows cell by cell with FPDF."""
+    pdf = FPDF()
+    pdf.add_page()
+    
+    # Header
+    pdf.set_font("Arial", 'B', 16)
+    pdf.cell(0, 10, "Weekly Resolved Tickets Report", 0, 1, 'C')
+    pdf.ln(10)
+    
+    # Table Header
+    pdf.set_font("Arial", 'B', 10)
+    col_widths = _PDF_COL_WIDTHS
+    headers = _PDF_HEADERS
+    for i, header in enumerate(headers):
+        pdf.cell(col_widths[i], 10, header, 1, 0, 'C')
+    pdf.ln()
+    
+    # Table Rows: convert every value up front so the loop only emits cells
+    rows = [tuple(zip(col_widths, map(str, row))) for row in report_data]
+    pdf.set_font("Arial", '', 10)
+    for row in rows:
+        for width, text in row:
+            pdf.cell(width, 10, text, 1, 0)
+        pdf.ln()
+
+    # Render the whole document to memory and write it out in one call
+    data = pdf.output(dest='S')
+    if isinstance(data, str):
+        # PyFPDF 1.7 returns the document as a latin-1 string
+        data = data.encode('latin-1')
+    with open(filename, 'wb') as f:
+        f.write(data)
+
+
+class DBWorker:
+    """
+    Runs blocking database work on one background thread. Each finished call is queued on
+    `results` as (handler, value, failed); the Tk thread drains that queue and calls the
+    handlers, so no widget is ever touched from the worker.
+    """
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self.results = queue.Queue()
+        threading.Thread(target=self._run, name="DBWorker", daemon=True).start()
+
+    def submit(self, fn, *args, callback=None, errback=None):
+        """Queues fn(*args); callback gets its result and errback any exception it raises."""
+        self._jobs.put((fn, args, callback, errback))
+
+    def _run(self):
+        while True:
+            fn, args, callback, errback = self._jobs.get()
+            try:
+                result = fn(*args)
+            except Exception as e:
+                self.results.put((errback, e, True))
+            else:
+                self.results.put((callback, result, False))
+
+
 # --- GUI APPLICATION ---
 class TicketingApp(tb.Window): # Use tb.Window for themes
     """Main application class that manages frames and user session."""
+    # How often finished worker results are collected, and how many are handled per tick
+    _DRAIN_INTERVAL_MS = 16
+    _DRAIN_BATCH = 32
+
     def __init__(self, db):
         # Change the theme name here.
         # Examples: "superhero", "darkly", "cosmo", "flatly", "journal", "lumen", "minty", "pulse", "sandstone", "united", "yeti"
@@ -71,16 +306,29 @@ class TicketingApp(tb.Window): # Use tb.Window for themes
         
         # The 'style' object is automatically created and attached to the Window
         self.style.configure('TFrame', background=self.style.lookup('TFrame', 'background'))
-        self.style.configure('TLabel', font=('Arial', 12))
-        self.style.configure('TButton', font=('Arial', 12))
-        self.style.configure('TEntry', font=('Arial', 12))
+        self.style.configure('TLabel', font=_DEFAULT_FONT)
+        self.style.configure('TButton', font=_DEFAULT_FONT)
+        self.style.configure('TEntry', font=_DEFAULT_FONT)
 
         self.container = ttk.Frame(self)
         self.container.pack(fill="both", expand=True)
 
-        self.frames = {}
+        # Tk's own parent/child links keep live frames alive; destroyed dashboards drop out on their own
+        self.frames = weakref.WeakValueDictionary()
         self.current_user = None
 
+        # Short-lived memo of dashboard queries, see cached_db()
+        # Entries are (result, fetched_at). Fetches run on the worker while invalidate_cache()
+        # runs on the Tk thread, so both sides take the lock; the generation counter stops
+        # a fetch that began before an invalidation from storing its now-stale result.
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
+
+        # Database calls run on this worker; their callbacks are picked up by _drain_results()
+        self.db_worker = DBWorker()
+        self.after(self._DRAIN_INTERVAL_MS, self._drain_results)
+
         for F in (LoginFrame, RegisterFrame):
             frame = F(self.container, self)
             self.frames[F.__name__] = frame
@@ -88,9 +336,62 @@ class TicketingApp(tb.Window): # Use tb.Window for themes
 
         self.show_frame("LoginFrame")
 
+    def cached_db(self, key, fn, ttl=2.0):
+        """
+        Returns fn()'s result, reusing the one fetched under `key` if it is younger than `ttl` seconds.
+        Safe to call from the worker thread; fn() itself runs without the lock held.
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            generation = self._cache_generation
+        if entry is not None and now - entry[1] < ttl:
+            return entry[0]
+        result = fn()
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._cache[key] = (result, now)
+        return result
+
+    def run_async(self, work_fn, on_done, on_error=None):
+        """
+        Runs work_fn on the database worker so slow queries don't freeze the UI, then
+        hands its result to on_done (or the exception to on_error) on the Tk thread.
+        """
+        self.db_worker.submit(work_fn, callback=on_done, errback=on_error)
+
+    def _drain_results(self):
+        """Calls the handlers of up to _DRAIN_BATCH finished worker jobs, then polls again."""
+        try:
+            for _ in range(self._DRAIN_BATCH):
+                try:
+                    handler, value, failed = self.db_worker.results.get_nowait()
+                except queue.Empty:
+                    break
+                if failed:
+                    (handler or self._show_async_error)(value)
+                elif handler is not None:
+                    handler(value)
+        finally:
+            # Keep polling even if a handler raised
+            self.after(self._DRAIN_INTERVAL_MS, self._drain_results)
+
+    def _show_async_error(self, error):
+        Messagebox.show_error(f"An error occurred: {error}", "Error")
+
+    def invalidate_cache(self):
+        """Drops all memoized query results; called after any write to the database."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_generation += 1
+
     def show_frame(self, page_name):
         """Brings the specified frame to the front."""
-        frame = self.frames[page_name]
+        try:
+            frame = self.frames[page_name]
+        except KeyError:
+            # The dashboard was destroyed and collected; send the user back to the login screen
+            frame = self.frames["LoginFrame"]
         frame.tkraise()
 
     def login_success(self, user_data):
@@ -106,15 +407,23 @@ class TicketingApp(tb.Window): # Use tb.Window for themes
             dashboard_class = RequesterDashboard
 
         if dashboard_class:
-            # Destroy old dashboards if they exist to refresh data
-            if 'AdminDashboard' in self.frames: self.frames['AdminDashboard'].destroy()
-            if 'AgentDashboard' in self.frames: self.frames['AgentDashboard'].destroy()
-            if 'RequesterDashboard' in self.frames: self.frames['RequesterDashboard'].destroy()
+            page_name = dashboard_class.__name__
+            user_key = (self.current_user['role'], self.current_user['id'])
+            frame = self.frames.get(page_name)
 
-            frame = dashboard_class(self.container, self)
-            self.frames[dashboard_class.__name__] = frame
-            frame.grid(row=0, column=0, sticky="nsew")
-            self.show_frame(dashboard_class.__name__)
+            if frame is not None and frame.user_key == user_key:
+                # Same user logging back in: keep the widgets, but reset the inputs and reload the data
+                frame.reset_for_user()
+            else:
+                # A dashboard built for someone else shows their name and data, so rebuild it
+                if frame is not None:
+                    frame.destroy()
+                frame = dashboard_class(self.container, self)
+                frame.user_key = user_key
+                self.frames[page_name] = frame
+                frame.grid(row=0, column=0, sticky="nsew")
+
+            self.show_frame(page_name)
 
     def logout(self):
         """Logs out the current user and returns to the login screen."""
@@ -155,13 +464,16 @@ class LoginFrame(ttk.Frame):
             Messagebox.show_error("Username and password cannot be empty.", "Error")
             return
 
-        user_data = self.controller.db.check_credentials(username, password)
-        if user_data:
-            self.username_entry.delete(0, 'end')
-            self.password_entry.delete(0, 'end')
-            self.controller.login_success(user_data)
-        else:
-            Messagebox.show_error("Invalid username or password.", "Login Failed")
+        def on_checked(user_data):
+            if user_data:
+                self.username_entry.delete(0, 'end')
+                self.password_entry.delete(0, 'end')
+                self.controller.login_success(user_data)
+            else:
+                Messagebox.show_error("Invalid username or password.", "Login Failed")
+
+        # Password hashing is deliberately slow, so verify off the Tk thread
+        self.controller.run_async(lambda: self.controller.db.check_credentials(username, password), on_checked)
 
 class RegisterFrame(ttk.Frame):
     """Registration screen for new requesters."""
@@ -204,17 +516,28 @@ class RegisterFrame(ttk.Frame):
             Messagebox.show_error("Passwords do not match.", "Error")
             return
             
-        success, message = self.controller.db.register_user(username, password, 'requester')
-        if success:
-            Messagebox.show_info(message, "Success")
-            self.controller.show_frame("LoginFrame")
-        else:
-            Messagebox.show_error(message, "Registration Failed")
+        def on_registered(outcome):
+            success, message = outcome
+            self.controller.invalidate_cache()
+            if success:
+                Messagebox.show_info(message, "Success")
+                self.controller.show_frame("LoginFrame")
+            else:
+                Messagebox.show_error(message, "Registration Failed")
+
+        self.controller.run_async(
+            lambda: self.controller.db.register_user(username, password, 'requester'), on_registered
+        )
 
 # --- DASHBOARDS ---
 
 class AdminDashboard(ttk.Frame):
     """Admin dashboard with multiple tabs for managing the system."""
+    # (column, heading) pairs for each Treeview, resolved once at class definition
+    _TICKET_COLUMNS = (("id", "ID"), ("title", "Title"), ("status", "Status"), ("requester", "Requester"), ("agent", "Agent"), ("created_at", "Created At"))
+    _REPORT_COLUMNS = (("id", "ID"), ("title", "Title"), ("agent", "Agent"), ("resolved_at", "Resolved At"))
+    _PERF_COLUMNS = (("agent", "Agent"), ("assigned", "Assigned Tickets"), ("resolved", "Resolved Tickets"), ("avg_resolution_time", "Avg. Resolution Time"))
+
     def __init__(self, parent, controller):
         super().__init__(parent, padding="10")
         self.controller = controller
@@ -244,16 +567,34 @@ class AdminDashboard(ttk.Frame):
         self.populate_reports_tab()
         self.populate_performance_tab()
 
+    def reset_for_user(self):
+        """Clears inputs and stale reports and reloads the data, reusing the existing widgets."""
+        self.agent_username_entry.delete(0, 'end')
+        self.agent_password_entry.delete(0, 'end')
+        self._agents_cache = None
+        # Also cancels any report still being inserted in chunks
+        _refill_tree_in_chunks(self.report_tree, ())
+        _refill_tree_in_chunks(self.perf_tree, ())
+        self.refresh_tickets_list()
+        self.refresh_agents_list()
+        self.refresh_user_counts()
+
     def populate_tickets_tab(self):
         """Create and fill the 'All Tickets' tab."""
         # Treeview for displaying tickets
-        columns = ("id", "title", "status", "requester", "agent", "created_at")
+        columns = [key for key, _ in self._TICKET_COLUMNS]
         self.tickets_tree = tb.Treeview(self.tickets_tab, columns=columns, show="headings", bootstyle="primary")
-        for col in columns:
-            self.tickets_tree.heading(col, text=col.replace('_', ' ').title())
-            self.tickets_tree.column(col, width=100)
+        for key, label in self._TICKET_COLUMNS:
+            self.tickets_tree.heading(key, text=label)
+            self.tickets_tree.column(key, width=100)
         self.tickets_tree.pack(expand=True, fill="both")
+        _track_ticket_selection(self)
+        # Detached rows kept for reuse by the next refresh, see _refill_tree()
+        self._ticket_item_pool = []
         self.refresh_tickets_list()
+        # Prefetch the agents offered by the assign dialog
+        self._agents_cache = None
+        self._get_agents()
 
         # Action buttons
         action_frame = tb.Frame(self.tickets_tab, padding="10")
@@ -265,44 +606,35 @@ class AdminDashboard(ttk.Frame):
 
     def refresh_tickets_list(self):
         """Clears and re-populates the tickets treeview."""
-        for item in self.tickets_tree.get_children():
-            self.tickets_tree.delete(item)
-        for ticket in self.controller.db.get_all_tickets():
-            self.tickets_tree.insert("", "end", values=ticket)
+        def fetch():
+            tickets = self.controller.cached_db('all_tickets', lambda: list(self.controller.db.get_all_tickets()))
+            return [
+                (ticket_id, title, status, requester['name'], agent['name'], created_at)
+                for ticket_id, title, status, requester, agent, created_at in tickets
+            ]
+
+        def show(rows):
+            self._selected_ticket = None
+            _refill_tree(self.tickets_tree, rows, pool=self._ticket_item_pool)
+
+        self.controller.run_async(fetch, show)
 
     def view_ticket_details(self, event=None):
         """Shows a popup with full ticket details."""
-        selected_item = self.tickets_tree.focus()
-        if not selected_item:
+        if not self._selected_ticket:
             Messagebox.show_warning("Please select a ticket to view.", "No Selection")
             return
-        ticket_id = int(self.tickets_tree.item(selected_item)['values'][0])
+        ticket_id = self._selected_ticket[0]
         details = self.controller.db.get_ticket_details(ticket_id)
         if details:
-            details_str = (
-                f"ID: {details[0]}\n"
-                f"Title: {details[1]}\n"
-                f"Description: {details[2]}\n"
-                f"Status: {details[3]}\n"
-                f"Requester: {details[4]}\n"
-                f"Agent: {details[5]}\n"
-                f"Created At: {details[6]}\n"
-                f"Last Updated: {details[7] or 'N/A'}\n"
-            )
-            
-            if details[8]: # resolved_at is not null
-                resolution_time = format_timedelta(details[6], details[8])
-                details_str += f"Resolution Time: {resolution_time}"
-
-            Messagebox.show_info(details_str, f"Ticket #{ticket_id} Details")
+            Messagebox.show_info(_format_ticket_details(details), f"Ticket #{ticket_id} Details")
             
     def assign_ticket_window(self):
         """Opens a window to assign a selected ticket to an agent."""
-        selected_item = self.tickets_tree.focus()
-        if not selected_item:
+        if not self._selected_ticket:
             Messagebox.show_warning("Please select a ticket to assign.", "No Selection")
             return
-        ticket_id = int(self.tickets_tree.item(selected_item)['values'][0])
+        ticket_id = self._selected_ticket[0]
 
         assign_win = tb.Toplevel(self)
         assign_win.title(f"Assign Ticket #{ticket_id}")
@@ -310,8 +642,8 @@ class AdminDashboard(ttk.Frame):
 
         tb.Label(assign_win, text="Select Agent:").pack(pady=10)
         
-        agents = self.controller.db.get_users_by_role('agent')
-        agent_names = [agent[1] for agent in agents]
+        name_to_id = self._get_agents()
+        agent_names = list(name_to_id)
         
         agent_combobox = tb.Combobox(assign_win, values=agent_names, state="readonly", bootstyle="info")
         agent_combobox.pack(pady=5)
@@ -323,16 +655,23 @@ class AdminDashboard(ttk.Frame):
                 return
             
             # Find agent ID from name
-            agent_id = next((agent[0] for agent in agents if agent[1] == selected_agent_name), None)
+            agent_id = name_to_id.get(selected_agent_name)
 
             if agent_id:
                 self.controller.db.assign_ticket(ticket_id, agent_id)
+                self.controller.invalidate_cache()
                 Messagebox.show_info(f"Ticket #{ticket_id} assigned to {selected_agent_name}.", "Success")
                 self.refresh_tickets_list()
                 assign_win.destroy()
         
         tb.Button(assign_win, text="Assign", command=do_assign, bootstyle="success").pack(pady=10)
 
+    def _get_agents(self):
+        """Returns the agent name-to-id mapping, loading it on first use after an invalidation."""
+        if self._agents_cache is None:
+            self._agents_cache = {agent[1]: agent[0] for agent in self.controller.db.get_users_by_role('agent')}
+        return self._agents_cache
+
     def populate_users_tab(self):
         """Create and fill the 'Manage Users' tab."""
         # Form for adding new agents
@@ -358,7 +697,7 @@ class AdminDashboard(ttk.Frame):
         self.requester_count_label.pack(anchor="w")
 
         # Treeview for displaying agents
-        tb.Label(self.users_tab, text="Existing Agents", font=("Arial", 12)).pack(pady=(20, 5))
+        tb.Label(self.users_tab, text="Existing Agents", font=_DEFAULT_FONT).pack(pady=(20, 5))
         self.agents_tree = tb.Treeview(self.users_tab, columns=("id", "username"), show="headings", bootstyle="primary")
         self.agents_tree.heading("id", text="ID")
         self.agents_tree.heading("username", text="Username")
@@ -374,26 +713,32 @@ class AdminDashboard(ttk.Frame):
             Messagebox.show_error("Username and password are required.", "Error")
             return
 
-        success, message = self.controller.db.register_user(username, password, role='agent')
-        if success:
-            Messagebox.show_info("Agent created successfully.", "Success")
-            self.agent_username_entry.delete(0, 'end')
-            self.agent_password_entry.delete(0, 'end')
-            self.refresh_agents_list()
-            self.refresh_user_counts()
-        else:
-            Messagebox.show_error(message, "Error")
+        def on_registered(outcome):
+            success, message = outcome
+            self.controller.invalidate_cache()
+            self._agents_cache = None
+            if success:
+                Messagebox.show_info("Agent created successfully.", "Success")
+                self.agent_username_entry.delete(0, 'end')
+                self.agent_password_entry.delete(0, 'end')
+                self.refresh_agents_list()
+                self.refresh_user_counts()
+            else:
+                Messagebox.show_error(message, "Error")
+
+        # Password hashing is deliberately slow, so keep it off the Tk thread
+        self.controller.run_async(
+            lambda: self.controller.db.register_user(username, password, role='agent'), on_registered
+        )
             
     def refresh_agents_list(self):
         """Clears and re-populates the agents treeview."""
-        for item in self.agents_tree.get_children():
-            self.agents_tree.delete(item)
-        for agent in self.controller.db.get_users_by_role('agent'):
-            self.agents_tree.insert("", "end", values=agent)
+        agents = self.controller.cached_db(('users', 'agent'), lambda: self.controller.db.get_users_by_role('agent'))
+        _refill_tree(self.agents_tree, (tuple(agent) for agent in agents))
             
     def refresh_user_counts(self):
         """Updates the labels displaying user counts."""
-        counts = self.controller.db.count_users()
+        counts = self.controller.cached_db('user_counts', self.controller.db.count_users)
         self.agent_count_label.config(text=f"Total Agents: {counts.get('agent', 0)}")
         self.requester_count_label.config(text=f"Total Requesters: {counts.get('requester', 0)}")
 
@@ -405,101 +750,86 @@ class AdminDashboard(ttk.Frame):
         tb.Button(button_frame, text="Generate 'Tickets Resolved This Week' Report", command=self.generate_weekly_report, bootstyle="primary").pack(side="left", padx=10)
         tb.Button(button_frame, text="Export to PDF", command=self.generate_pdf_report, bootstyle="success").pack(side="left", padx=10)
         
-        columns = ("id", "title", "agent", "resolved_at")
+        columns = [key for key, _ in self._REPORT_COLUMNS]
         self.report_tree = tb.Treeview(self.reports_tab, columns=columns, show="headings", bootstyle="info")
-        for col in columns:
-            self.report_tree.heading(col, text=col.replace('_', ' ').title())
+        for key, label in self._REPORT_COLUMNS:
+            self.report_tree.heading(key, text=label)
         self.report_tree.pack(expand=True, fill="both")
 
     def generate_weekly_report(self):
         """Fetches and displays the weekly report data."""
-        for item in self.report_tree.get_children():
-            self.report_tree.delete(item)
-        report_data = self.controller.db.get_weekly_report()
-        for row in report_data:
-            self.report_tree.insert("", "end", values=row)
-        Messagebox.show_info(f"Found {len(report_data)} tickets resolved in the last 7 days.", "Report Generated")
+        def show(rows):
+            _refill_tree_in_chunks(
+                self.report_tree, rows,
+                lambda count: Messagebox.show_info(f"Found {count} tickets resolved in the last 7 days.", "Report Generated"),
+            )
+
+        self.controller.run_async(lambda: [tuple(row) for row in self.controller.db.get_weekly_report()], show)
 
     def generate_pdf_report(self):
         """Generates a PDF file from the current report data."""
-        if not FPDF_AVAILABLE:
+        if not (REPORTLAB_AVAILABLE or FPDF_AVAILABLE):
             Messagebox.show_error("FPDF library not found. Please install it using: pip install fpdf", "Error")
             return
             
+        if getattr(self.report_tree, '_pending_refill', None) is not None:
+            Messagebox.show_warning("The report is still loading. Please try again in a moment.", "Report Loading")
+            return
+
         report_data = [self.report_tree.item(item)['values'] for item in self.report_tree.get_children()]
         
         if not report_data:
             Messagebox.show_warning("There is no report data to export. Please generate a report first.", "No Data")
             return
 
-        pdf = FPDF()
-        pdf.add_page()
-        
-        # Header
-        pdf.set_font("Arial", 'B', 16)
-        pdf.cell(0, 10, "Weekly Resolved Tickets Report", 0, 1, 'C')
-        pdf.ln(10)
-        
-        # Table Header
-        pdf.set_font("Arial", 'B', 10)
-        col_widths = [15, 80, 40, 50]
-        headers = ["ID", "Title", "Agent", "Resolved At"]
-        for i, header in enumerate(headers):
-            pdf.cell(col_widths[i], 10, header, 1, 0, 'C')
-        pdf.ln()
-        
-        # Table Rows
-        pdf.set_font("Arial", '', 10)
-        for row in report_data:
-            for i, item in enumerate(row):
-                pdf.cell(col_widths[i], 10, str(item), 1, 0)
-            pdf.ln()
-            
-        filename = f"weekly_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        try:
-            pdf.output(filename)
-            Messagebox.show_info(f"Report successfully saved as {filename}", "Success")
-        except Exception as e:
-            Messagebox.show_error(f"Could not save PDF file: {e}", "Error")
+        filename = f"weekly_report_{time.strftime('%Y%m%d_%H%M%S', time.localtime())}.pdf"
+        # Layout and file I/O happen on a worker thread; only the result dialogs touch Tk
+        self.controller.run_async(
+            lambda: _write_weekly_report_pdf(report_data, filename),
+            lambda _: Messagebox.show_info(f"Report successfully saved as {filename}", "Success"),
+            lambda e: Messagebox.show_error(f"Could not save PDF file: {e}", "Error"),
+        )
 
     def populate_performance_tab(self):
         """Create and fill the 'Performance' tab."""
         tb.Button(self.performance_tab, text="Generate Agent Performance Report", command=self.generate_performance_report, bootstyle="primary").pack(pady=20)
         
-        columns = ("agent", "assigned", "resolved", "avg_resolution_time")
+        columns = [key for key, _ in self._PERF_COLUMNS]
         self.perf_tree = tb.Treeview(self.performance_tab, columns=columns, show="headings", bootstyle="success")
-        self.perf_tree.heading("agent", text="Agent")
-        self.perf_tree.heading("assigned", text="Assigned Tickets")
-        self.perf_tree.heading("resolved", text="Resolved Tickets")
-        self.perf_tree.heading("avg_resolution_time", text="Avg. Resolution Time")
+        for key, label in self._PERF_COLUMNS:
+            self.perf_tree.heading(key, text=label)
         self.perf_tree.pack(expand=True, fill="both")
 
     def generate_performance_report(self):
         """Fetches and displays agent performance data."""
-        for item in self.perf_tree.get_children():
-            self.perf_tree.delete(item)
-        
-        report_data = self.controller.db.get_agent_performance_report()
-        
-        for row in report_data:
-            agent, assigned, resolved, avg_days = row
-            
-            resolved = resolved or 0 # Handle None from SUM if no tickets are resolved
-            
-            if avg_days is not None:
-                days = int(avg_days)
-                hours = (avg_days - days) * 24
-                time_str = f"{days}d {round(hours)}h"
-            else:
-                time_str = "N/A"
+        def report_rows():
+            for row in self.controller.db.get_agent_performance_report():
+                agent, assigned, resolved, avg_days = row
                 
-            self.perf_tree.insert("", "end", values=(agent, assigned, resolved, time_str))
-            
-        Messagebox.show_info(f"Performance report for {len(report_data)} agents has been generated.", "Report Generated")
+                resolved = resolved or 0 # Handle None from SUM if no tickets are resolved
+                
+                if avg_days is not None:
+                    days = int(avg_days)
+                    hours = (avg_days - days) * 24
+                    time_str = f"{days}d {round(hours)}h"
+                else:
+                    time_str = "N/A"
+                    
+                yield (agent, assigned, resolved, time_str)
+
+        def show(rows):
+            _refill_tree_in_chunks(
+                self.perf_tree, rows,
+                lambda count: Messagebox.show_info(f"Performance report for {count} agents has been generated.", "Report Generated"),
+            )
+
+        self.controller.run_async(lambda: list(report_rows()), show)
 
 
 class AgentDashboard(ttk.Frame):
     """Agent dashboard to view assigned tickets and update their status."""
+    _TICKET_COLUMNS = (("id", "ID"), ("title", "Title"), ("status", "Status"), ("requester", "Requester"), ("created_at", "Created At"))
+
     def __init__(self, parent, controller):
         super().__init__(parent, padding="10")
         self.controller = controller
@@ -510,14 +840,17 @@ class AgentDashboard(ttk.Frame):
         tb.Label(header_frame, text=f"Agent Dashboard - Welcome, {self.controller.current_user['username']}!", font=("Arial", 16), bootstyle="primary").pack(side="left")
         tb.Button(header_frame, text="Logout", command=controller.logout, bootstyle="danger").pack(side="right")
         
-        tb.Label(self, text="My Assigned Tickets", font=("Arial", 12), bootstyle="info").pack(pady=10)
+        tb.Label(self, text="My Assigned Tickets", font=_DEFAULT_FONT, bootstyle="info").pack(pady=10)
 
-        columns = ("id", "title", "status", "requester", "created_at")
+        columns = [key for key, _ in self._TICKET_COLUMNS]
         self.tickets_tree = tb.Treeview(self, columns=columns, show="headings", bootstyle="primary")
-        for col in columns:
-            self.tickets_tree.heading(col, text=col.replace('_', ' ').title())
-            self.tickets_tree.column(col, width=120)
+        for key, label in self._TICKET_COLUMNS:
+            self.tickets_tree.heading(key, text=label)
+            self.tickets_tree.column(key, width=120)
         self.tickets_tree.pack(expand=True, fill="both")
+        _track_ticket_selection(self)
+        # Detached rows kept for reuse by the next refresh, see _refill_tree()
+        self._ticket_item_pool = []
         self.refresh_tickets_list()
 
         action_frame = tb.Frame(self, padding="10")
@@ -527,47 +860,40 @@ class AgentDashboard(ttk.Frame):
         tb.Button(action_frame, text="Update Status", command=self.update_status_window, bootstyle="success").pack(side="left", padx=5)
         tb.Button(action_frame, text="Refresh", command=self.refresh_tickets_list, bootstyle="secondary").pack(side="left", padx=5)
 
+    def reset_for_user(self):
+        """Reloads the assigned tickets, reusing the existing widgets."""
+        self.refresh_tickets_list()
+
     def refresh_tickets_list(self):
         """Refreshes the list of assigned tickets."""
         agent_id = self.controller.current_user['id']
-        for item in self.tickets_tree.get_children():
-            self.tickets_tree.delete(item)
-        for ticket in self.controller.db.get_agent_tickets(agent_id):
-            self.tickets_tree.insert("", "end", values=ticket)
-            
+        def fetch():
+            tickets = self.controller.cached_db(('agent_tickets', agent_id), lambda: self.controller.db.get_agent_tickets(agent_id))
+            return [tuple(ticket) for ticket in tickets]
+
+        def show(rows):
+            self._selected_ticket = None
+            _refill_tree(self.tickets_tree, rows, pool=self._ticket_item_pool)
+
+        self.controller.run_async(fetch, show)
+
     def view_ticket_details(self):
         """Shows full details of a selected ticket."""
-        selected_item = self.tickets_tree.focus()
-        if not selected_item:
+        if not self._selected_ticket:
             Messagebox.show_warning("Please select a ticket to view.", "No Selection")
             return
-        ticket_id = int(self.tickets_tree.item(selected_item)['values'][0])
+        ticket_id = self._selected_ticket[0]
         details = self.controller.db.get_ticket_details(ticket_id)
         if details:
-            details_str = (
-                f"ID: {details[0]}\n"
-                f"Title: {details[1]}\n"
-                f"Description: {details[2]}\n"
-                f"Status: {details[3]}\n"
-                f"Requester: {details[4]}\n"
-                f"Created At: {details[6]}\n"
-            )
-
-            if details[8]: # resolved_at is not null
-                resolution_time = format_timedelta(details[6], details[8])
-                details_str += f"Resolution Time: {resolution_time}"
-
-            Messagebox.show_info(details_str, f"Ticket #{ticket_id} Details")
+            Messagebox.show_info(_format_ticket_details(details, include_agent=False), f"Ticket #{ticket_id} Details")
 
     def update_status_window(self):
         """Opens a window to update the status of a selected ticket."""
-        selected_item = self.tickets_tree.focus()
-        if not selected_item:
+        if not self._selected_ticket:
             Messagebox.show_warning("Please select a ticket.", "No Selection")
             return
-        # Ensure ticket_id is treated as an integer for reliability
-        ticket_id = int(self.tickets_tree.item(selected_item)['values'][0])
-        current_status = self.tickets_tree.item(selected_item)['values'][2]
+        # The id was converted to an integer when the row was selected
+        ticket_id, current_status = self._selected_ticket
 
         update_win = tb.Toplevel(self)
         update_win.title(f"Update Status for Ticket #{ticket_id}")
@@ -587,6 +913,7 @@ class AgentDashboard(ttk.Frame):
                 return
             
             self.controller.db.update_ticket_status(ticket_id, new_status)
+            self.controller.invalidate_cache()
             Messagebox.show_info(f"Ticket #{ticket_id} status updated to '{new_status}'.", "Success")
             self.refresh_tickets_list()
             update_win.destroy()
@@ -596,6 +923,8 @@ class AgentDashboard(ttk.Frame):
 
 class RequesterDashboard(ttk.Frame):
     """Requester dashboard to view their tickets and create new ones."""
+    _TICKET_COLUMNS = (("id", "ID"), ("title", "Title"), ("status", "Status"), ("agent", "Agent"), ("created_at", "Created At"))
+
     def __init__(self, parent, controller):
         super().__init__(parent, padding="10")
         self.controller = controller
@@ -621,6 +950,9 @@ class RequesterDashboard(ttk.Frame):
         tb.Label(create_frame, text="Description:").pack(anchor="w")
         self.desc_text = tk.Text(create_frame, height=10)
         self.desc_text.pack(fill="both", expand=True, pady=5)
+        # Bound once; the form is cleared after every submission
+        self._clear_title = self.title_entry.delete
+        self._clear_desc = self.desc_text.delete
         
         tb.Button(create_frame, text="Submit Ticket", command=self.submit_ticket, bootstyle="success").pack(pady=10)
 
@@ -628,22 +960,50 @@ class RequesterDashboard(ttk.Frame):
         list_frame = tb.LabelFrame(main_pane, text="My Submitted Tickets", padding="10", bootstyle="info")
         main_pane.add(list_frame, weight=2)
         
-        columns = ("id", "title", "status", "agent", "created_at")
-        self.tickets_tree = tb.Treeview(list_frame, columns=columns, show="headings", bootstyle="info")
-        for col in columns:
-            self.tickets_tree.heading(col, text=col.replace('_', ' ').title())
-            self.tickets_tree.column(col, width=100)
-        
-        # Define tags for status colors
-        self.tickets_tree.tag_configure('Open', background='red', foreground='white')
-        self.tickets_tree.tag_configure('In Progress', background='orange', foreground='black')
-        self.tickets_tree.tag_configure('Resolved', background='green', foreground='white')
+        tree_frame = tb.Frame(list_frame)
+        tree_frame.pack(expand=True, fill="both")
+
+        columns = [key for key, _ in self._TICKET_COLUMNS]
+        self.tickets_tree = tb.Treeview(tree_frame, columns=columns, show="headings", bootstyle="info")
+        for key, label in self._TICKET_COLUMNS:
+            self.tickets_tree.heading(key, text=label)
+            self.tickets_tree.column(key, width=100)
         
-        self.tickets_tree.pack(expand=True, fill="both")
+        # Define tags for status colors, once for the lifetime of the tree
+        for status, (background, foreground) in _STATUS_COLORS.items():
+            self.tickets_tree.tag_configure(status, background=background, foreground=foreground)
+
+        # Only the rows in view are attached to the tree, so the scrollbar tracks self._tickets instead
+        self.tickets_scroll = tb.Scrollbar(tree_frame, orient="vertical", command=self._on_scroll, bootstyle="info")
+        self.tickets_scroll.pack(side="right", fill="y")
+        self.tickets_tree.pack(side="left", expand=True, fill="both")
+
+        self._tickets = []       # every ticket row, in display order
+        self._first_row = 0      # index in self._tickets of the top visible row
+        self._ticket_cache = {}  # ticket id -> values of the item built for it, iid "t<id>"
+        self._ticket_index = {}  # ticket id -> latest values, built or not
+        self._last_refresh_ts = None # watermark for get_requester_tickets_since(); None until loaded
+        self._shown = []         # ticket ids currently attached, top to bottom
+        # Starting guesses from the tree's own style (bootstyle makes it info.Treeview);
+        # _render_viewport replaces them with the bbox of a built row once one is drawn
+        style_name = self.tickets_tree.cget('style') or 'Treeview'
+        self._row_height = int(float(self.controller.style.lookup(style_name, 'rowheight') or 20))
+        self._heading_height = self._row_height + 10 # ttkbootstrap pads headings by 5px a side
+        self._render_pending = False
+        self.tickets_tree.bind("<Configure>", lambda event: self._schedule_render())
+        self.tickets_tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tickets_tree.bind("<Button-4>", self._on_mousewheel) # X11 wheel up
+        self.tickets_tree.bind("<Button-5>", self._on_mousewheel) # X11 wheel down
         
         tb.Button(list_frame, text="Refresh", command=self.refresh_tickets_list, bootstyle="secondary").pack(pady=5, anchor="e")
         self.refresh_tickets_list()
 
+    def reset_for_user(self):
+        """Clears the new-ticket form and reloads the ticket list, reusing the existing widgets."""
+        self._clear_title(0, 'end')
+        self._clear_desc("1.0", "end")
+        self.refresh_tickets_list()
+
     def submit_ticket(self):
         """Submits a new ticket to the database."""
         title = self.title_entry.get()
@@ -654,19 +1014,149 @@ class RequesterDashboard(ttk.Frame):
             return
             
         requester_id = self.controller.current_user['id']
-        self.controller.db.create_ticket(title, description, requester_id)
-        
-        Messagebox.show_info("Ticket submitted successfully!", "Success")
-        self.title_entry.delete(0, 'end')
-        self.desc_text.delete("1.0", "end")
-        self.refresh_tickets_list()
+        self.controller.db_worker.submit(
+            self.controller.db.create_ticket, title, description, requester_id,
+            callback=self._on_submitted,
+        )
+
+    def _on_submitted(self, result):
+        """Runs on the Tk thread once the worker has stored the new ticket."""
+        self.controller.invalidate_cache()
+        self._clear_title(0, 'end')
+        self._clear_desc("1.0", "end")
+        # A self-dismissing toast instead of a modal dialog, so the form is usable right away
+        _show_toast(self, "Ticket submitted successfully!")
+        # Let this handler return to the event loop before the refresh is queued
+        self.after_idle(self.refresh_tickets_list)
         
     def refresh_tickets_list(self):
-        """Refreshes the list of submitted tickets with status colors."""
+        """
+        Refreshes the list of submitted tickets with status colors. Only tickets created or
+        changed since the previous refresh are fetched; the first call loads everything.
+        """
         requester_id = self.controller.current_user['id']
-        for item in self.tickets_tree.get_children():
-            self.tickets_tree.delete(item)
-        for ticket in self.controller.db.get_requester_tickets(requester_id):
-            # ticket values are (id, title, status, agent, created_at)
-            status = ticket[2]
-            self.tickets_tree.insert("", "end", values=ticket, tags=(status,))
\ No newline at end of file
+        last_ts = self._last_refresh_ts
+        def fetch():
+            return self.controller.db.get_requester_tickets_since(requester_id, last_ts)
+
+        def show(changes):
+            if not self.tickets_tree.winfo_exists():
+                return
+            self._reconcile(changes)
+            self._schedule_render()
+
+        self.controller.run_async(fetch, show)
+
+    def _reconcile(self, changes):
+        """
+        Merges fetched (id, title, status, agent, created_at, updated_at) rows into the list:
+        new tickets go on top, changed ones are updated in place, and only built items whose
+        values differ are touched, so unchanged rows cost no Tk calls.
+        """
+        tree = self.tickets_tree
+        cache = self._ticket_cache
+        index = self._ticket_index
+        added, updated = [], {}
+        # Rows from before updated_at was stamped on insert have none; "" still makes
+        # later refreshes incremental, since every newer row does carry a timestamp
+        watermark = self._last_refresh_ts or ""
+        for tid, title, status, agent, created_at, updated_at in changes:
+            assert status in _STATUS_INTERN, status
+            ticket = (tid, title, _STATUS_INTERN[status], agent, created_at)
+            if updated_at and updated_at > watermark:
+                watermark = updated_at
+            # `>=` in the query re-sends rows from the last second, so skip ones we already have
+            if index.get(tid) == ticket:
+                continue
+            if tid in index:
+                updated[tid] = ticket
+            else:
+                added.append(ticket)
+            index[tid] = ticket
+            cached = cache.get(tid)
+            if cached is not None:
+                tree.item(f"t{tid}", values=ticket, tags=_STATUS_TAGS[ticket[2]])
+                cache[tid] = ticket
+        self._last_refresh_ts = watermark
+        if updated:
+            self._tickets = [updated.get(ticket[0], ticket) for ticket in self._tickets]
+        if added:
+            # The query has no ORDER BY; show newest first, matching get_requester_tickets
+            added.sort(key=lambda ticket: (ticket[4], ticket[0]), reverse=True)
+            self._tickets = added + self._tickets
+
+    def _visible_rows(self):
+        """Number of rows that fit below the heading at the tree's current height."""
+        return max(1, (self.tickets_tree.winfo_height() - self._heading_height) // self._row_height)
+
+    def _schedule_render(self):
+        """
+        Coalesces every resize, scroll and refresh that arrives before the next idle cycle
+        into a single _render_viewport pass, so a burst of events costs one batch of tree updates.
+        """
+        if not self._render_pending:
+            self._render_pending = True
+            self.tickets_tree.after_idle(self._render_viewport)
+
+    def _render_viewport(self):
+        """
+        Attaches just the rows that fit in the viewport, creating their items on first use
+        and detaching the ones that scrolled out, so a refresh costs O(viewport) rather than O(N).
+        """
+        self._render_pending = False
+        tree = self.tickets_tree
+        if not tree.winfo_exists():
+            return
+        total = len(self._tickets)
+        visible = self._visible_rows()
+        first = self._first_row = max(0, min(self._first_row, total - visible))
+        last = min(total, first + visible)
+
+        window = self._tickets[first:last]
+        wanted = [ticket[0] for ticket in window]
+        if wanted != self._shown:
+            wanted_set = set(wanted)
+            stale = [f"t{tid}" for tid in self._shown if tid not in wanted_set]
+            if stale:
+                tree.detach(*stale)
+            # ticket values are (id, title, status, agent, created_at); rows are tagged by status
+            for pos, ticket in enumerate(window):
+                tid = ticket[0]
+                if tid in self._ticket_cache:
+                    tree.move(f"t{tid}", "", pos)
+                else:
+                    tree.insert("", pos, iid=f"t{tid}", values=ticket, tags=_STATUS_TAGS[ticket[2]])
+                    self._ticket_cache[tid] = ticket
+            self._shown = wanted
+
+        if self._shown:
+            # Measure a real row: its height, and its y offset, which is the heading's height
+            bbox = tree.bbox(f"t{self._shown[0]}")
+            if bbox:
+                _, y, _, height = bbox
+                if height > 0 and (height, y) != (self._row_height, self._heading_height):
+                    self._row_height, self._heading_height = height, y
+                    # The slice was sized from the old numbers; redo it with the measured ones
+                    self._schedule_render()
+
+        if total:
+            self.tickets_scroll.set(first / total, last / total)
+        else:
+            self.tickets_scroll.set(0, 1)
+
+    def _on_scroll(self, action, amount, unit=None):
+        """Scrollbar command: 'moveto fraction' or 'scroll n units|pages'."""
+        if action == "moveto":
+            self._first_row = int(float(amount) * len(self._tickets))
+        else:
+            step = self._visible_rows() if unit == "pages" else 1
+            self._first_row += int(amount) * step
+        self._schedule_render()
+
+    def _on_mousewheel(self, event):
+        """Scrolls the virtual list by wheel notches instead of the tree's own (empty) overflow."""
+        if event.num == 4 or event.delta > 0:
+            self._on_scroll("scroll", -1, "units")
+        else:
+            self._on_scroll("scroll", 1, "units")
+        return "break"
\ No newline at end of file